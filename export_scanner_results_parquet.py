@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Export scanner_results to Parquet, partitioned by scan day.
+Each day lands in <output>/scan_day=YYYY-MM-DD/*.parquet (ZSTD compressed), so
+queries that filter on scan_day only read that day's files and only the
+columns they select.
+
+Usage: python export_scanner_results_parquet.py [output_dir]
+
+Read it back with:
+    SELECT ... FROM read_parquet('<output>/*/*.parquet', hive_partitioning = true)
+    WHERE scan_day = DATE '2025-11-04'
+"""
+import duckdb
+import os
+import sys
+
+DUCKDB_PATH = os.environ.get('DUCKDB_PATH', '/Users/george/scannerPOC/breakoutScannersPOCs/scanner_data.duckdb')
+OUTPUT_DIR = sys.argv[1] if len(sys.argv) > 1 else 'datasets/scanner_results_parquet'
+
+print(f"Connecting to: {DUCKDB_PATH}")
+conn = duckdb.connect(DUCKDB_PATH, read_only=True)
+
+print(f"Exporting scanner_results to {OUTPUT_DIR} ...")
+conn.execute(f"""
+    COPY (
+        SELECT *, CAST(scan_date AS DATE) as scan_day
+        FROM scanner_data.scanner_results
+        ORDER BY scan_day, scanner_name, symbol
+    ) TO '{OUTPUT_DIR}' (FORMAT PARQUET, PARTITION_BY (scan_day), COMPRESSION ZSTD, OVERWRITE_OR_IGNORE)
+""")
+
+days = conn.execute(f"""
+    SELECT scan_day, COUNT(*)
+    FROM read_parquet('{OUTPUT_DIR}/*/*.parquet', hive_partitioning = true)
+    GROUP BY scan_day
+    ORDER BY scan_day DESC
+""").fetchall()
+print(f"✅ Wrote {sum(count for _, count in days)} rows across {len(days)} scan days")
+for scan_day, count in days[:10]:
+    print(f"  {scan_day}: {count} rows")
+
+conn.close()
@@ -0,0 +1,14 @@
+"""
+SQL for the numeric value of fundamental_cache.market_cap, shared by the web
+app's on-the-fly filter and refresh_derived_tables.py's market_cap_values.
+"""
+
+
+def market_cap_value_sql(column):
+    """CASE expression for `column` (display strings like "3.99T", "1.5B", "500M" or plain numbers); NULL if unparseable."""
+    return f"""(CASE
+        WHEN upper({column}) LIKE '%T%' THEN TRY_CAST(replace(upper({column}), 'T', '') AS DOUBLE) * 1e12
+        WHEN upper({column}) LIKE '%B%' THEN TRY_CAST(replace(upper({column}), 'B', '') AS DOUBLE) * 1e9
+        WHEN upper({column}) LIKE '%M%' THEN TRY_CAST(replace(upper({column}), 'M', '') AS DOUBLE) * 1e6
+        ELSE TRY_CAST({column} AS DOUBLE)
+    END)"""
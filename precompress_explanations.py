@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Pack the scanner write-ups in static/explanations/ into explanations.bin.
+Each fragment is stored plain, gzipped and (if the brotli package is installed)
+brotli-compressed, followed by a JSON index of
+{name: {encoding: [offset, length], 'sha256': <hash of the .html>}} and the
+index length as 8 little-endian bytes. The app mmaps the file once and serves
+/explanations/<name> without compressing per request; fragments whose .html no
+longer matches the stored hash are read from the file instead.
+Run at build time, and again after editing any write-up.
+"""
+
+import os
+import gzip
+import hashlib
+import json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+EXPLANATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'explanations')
+BLOB_PATH = os.path.join(EXPLANATIONS_DIR, 'explanations.bin')
+
+
+def precompress_explanations():
+    """Write explanations.bin with every fragment in every supported encoding."""
+    if brotli is None:
+        print("brotli not installed, packing plain and gzip only")
+
+    index = {}
+    offset = 0
+    with open(BLOB_PATH + '.tmp', 'wb') as out:
+        for name in sorted(os.listdir(EXPLANATIONS_DIR)):
+            if not name.endswith('.html'):
+                continue
+            with open(os.path.join(EXPLANATIONS_DIR, name), 'rb') as f:
+                data = f.read()
+
+            encoded = {
+                'identity': data,
+                'gzip': gzip.compress(data, 9, mtime=0),
+            }
+            if brotli is not None:
+                encoded['br'] = brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+
+            entry = index[name[:-len('.html')]] = {'sha256': hashlib.sha256(data).hexdigest()}
+            for encoding, payload in encoded.items():
+                out.write(payload)
+                entry[encoding] = [offset, len(payload)]
+                offset += len(payload)
+
+            sizes = ', '.join(f"{encoding} {len(payload)}" for encoding, payload in encoded.items())
+            print(f"  {name}: {sizes}")
+
+        index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+        out.write(index_bytes)
+        out.write(len(index_bytes).to_bytes(8, 'little'))
+
+    os.replace(BLOB_PATH + '.tmp', BLOB_PATH)
+    print(f"✅ Packed {len(index)} write-ups into {BLOB_PATH}")
+
+
+if __name__ == '__main__':
+    precompress_explanations()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Rebuild the lookup tables the web app derives from scanner_results, and make
+sure the indexes its queries use exist.
+Run after every scanner run (after new rows are written to scanner_results);
+the ingest scripts call it when they finish.
+Each table is stored with a stamp of the source data it was built from. The
+app only reads a table while its source stamp still matches and falls back to
+computing the same data per request otherwise. The app itself only opens the
+database read-only, so schema changes live here.
+
+Usage: python refresh_derived_tables.py
+"""
+import duckdb
+import os
+
+from market_cap_sql import market_cap_value_sql
+
+DUCKDB_PATH = os.environ.get('DUCKDB_PATH', '/Users/george/scannerPOC/breakoutScannersPOCs/scanner_data.duckdb')
+
+# Table name -> query it is rebuilt from
+DERIVED_TABLES = {
+    # For every (symbol, scanner) pair, that symbol's hits on the other scanners,
+    # newest first - shown as "Confirmed by other scanners" on the dashboard
+    'scanner_data.scanner_confirmations': """
+        SELECT p.symbol,
+               p.scanner_name,
+               array_agg({
+                   'scanner': o.scanner_name,
+                   'date': COALESCE(left(CAST(o.scan_date AS VARCHAR), 10), ''),
+                   'strength': o.signal_strength
+               } ORDER BY o.scan_date DESC, o.scanner_name) as confirmations
+        FROM (SELECT DISTINCT symbol, scanner_name FROM scanner_data.scanner_results) p
+        JOIN scanner_data.scanner_results o
+          ON o.symbol = p.symbol AND o.scanner_name != p.scanner_name
+        GROUP BY p.symbol, p.scanner_name
+    """,
+    # Setups per scan day and scanner - dashboard scanner counts and scan dates
+    'scanner_data.scan_day_counts': """
+        SELECT CAST(scan_date AS DATE) as scan_day, scanner_name, COUNT(*) as count
+        FROM scanner_data.scanner_results
+        GROUP BY scan_day, scanner_name
+        ORDER BY scan_day, scanner_name
+    """,
+    # Numeric market cap per symbol (fundamental_cache stores display strings;
+    # same parsing as the app's on-the-fly filter) - dashboard minimum
+    # market-cap filter
+    'scanner_data.market_cap_values': f"""
+        SELECT symbol, market_cap_value
+        FROM (
+            SELECT symbol,
+                   {market_cap_value_sql('market_cap')} as market_cap_value
+            FROM scanner_data.fundamental_cache
+        )
+        WHERE market_cap_value IS NOT NULL
+        ORDER BY symbol
+    """,
+    # One row per ticker with scanner results - dashboard ticker autocomplete
+    'scanner_data.ticker_universe': """
+        SELECT DISTINCT symbol
+        FROM scanner_data.scanner_results
+        ORDER BY symbol
+    """,
+}
+
+# Stamp queries that change whenever a source table's data does: row count
+# plus a hash over the columns the derived tables read, so a day that is
+# deleted and re-inserted with the same number of rows still changes it.
+SOURCE_STAMPS = {
+    'scanner_data.scanner_results': """
+        SELECT CAST(COUNT(*) AS VARCHAR) || '|' || COALESCE(CAST(bit_xor(hash(symbol, scanner_name, scan_date, signal_strength)) AS VARCHAR), '')
+        FROM scanner_data.scanner_results
+    """,
+    'scanner_data.fundamental_cache': """
+        SELECT CAST(COUNT(*) AS VARCHAR) || '|' || COALESCE(CAST(bit_xor(hash(symbol, market_cap)) AS VARCHAR), '')
+        FROM scanner_data.fundamental_cache
+    """,
+}
+
+# Derived table -> source table it is built from
+DERIVED_TABLE_SOURCES = {
+    'scanner_data.scanner_confirmations': 'scanner_data.scanner_results',
+    'scanner_data.scan_day_counts': 'scanner_data.scanner_results',
+    'scanner_data.market_cap_values': 'scanner_data.fundamental_cache',
+    'scanner_data.ticker_universe': 'scanner_data.scanner_results',
+}
+
+# Indexes the app's lookups use: per-symbol (ticker search, confirmations),
+# per-scanner with an optional scan_date range (dashboard, scanner pages;
+# the leading scanner_name also serves scanner + ticker), and latest daily
+# bar per symbol. Indexes created by earlier versions and now covered by
+# these are dropped so writers don't maintain them.
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_sr_symbol ON scanner_data.scanner_results(symbol)",
+    "CREATE INDEX IF NOT EXISTS idx_sr_scanner_date_symbol ON scanner_data.scanner_results(scanner_name, scan_date, symbol)",
+    "CREATE INDEX IF NOT EXISTS idx_dc_symbol_date ON scanner_data.daily_cache(symbol, date)",
+    "DROP INDEX IF EXISTS scanner_data.idx_sr_scanner",
+    "DROP INDEX IF EXISTS scanner_data.idx_sr_scanner_symbol",
+    "DROP INDEX IF EXISTS scanner_data.idx_sr_scan_date",
+]
+
+
+def refresh_derived_tables(conn=None):
+    """Recreate every table in DERIVED_TABLES with its source stamp and apply INDEXES.
+
+    Uses `conn` if given (an ingest script's writable connection), otherwise
+    opens DUCKDB_PATH.
+    """
+    own_conn = conn is None
+    if own_conn:
+        print(f"Connecting to: {DUCKDB_PATH}")
+        conn = duckdb.connect(DUCKDB_PATH)
+    try:
+        # Stamp the sources before building, so rows written meanwhile make
+        # the tables look stale rather than current
+        stamps = {source: conn.execute(query).fetchone()[0] for source, query in SOURCE_STAMPS.items()}
+        for table, query in DERIVED_TABLES.items():
+            conn.execute(f"CREATE OR REPLACE TABLE {table} AS {query}")
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            print(f"  {table}: {count} rows")
+        conn.execute("""
+            CREATE OR REPLACE TABLE scanner_data.derived_table_sources (
+                table_name VARCHAR,
+                stamp_query VARCHAR,
+                source_stamp VARCHAR
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO scanner_data.derived_table_sources VALUES (?, ?, ?)",
+            [(table, SOURCE_STAMPS[source], stamps[source]) for table, source in DERIVED_TABLE_SOURCES.items()])
+        for statement in INDEXES:
+            conn.execute(statement)
+        print(f"  {len(INDEXES)} index statement(s) applied")
+    finally:
+        if own_conn:
+            conn.close()
+    print(f"✅ Refreshed {len(DERIVED_TABLES)} derived table(s)")
+
+if __name__ == '__main__':
+    refresh_derived_tables()
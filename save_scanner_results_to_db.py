@@ -19,6 +19,7 @@ from explosive_volume_scanner import (detect_explosive_volume_3x,
                                        detect_explosive_volume_10x,
                                        detect_volume_surge_with_price)
 from pattern_scoring import calculate_pattern_strength, get_signal_quality
+from refresh_derived_tables import refresh_derived_tables
 
 # Database path
 DB_PATH = os.environ.get('DUCKDB_PATH', '/Users/george/scannerPOC/breakoutScannersPOCs/scanner_data.duckdb')
@@ -163,6 +164,14 @@ def run_scanners_and_save():
         
         print(f"✅ Saved {len(results)} scanner results to database")
         
+        # Rebuild the dashboard's lookup tables from the new results
+        print("\n🔄 Refreshing derived tables...")
+        try:
+            refresh_derived_tables(conn)
+        except Exception as e:
+            # The app computes the data per request until the next refresh
+            print(f"⚠️ Could not refresh derived tables: {e}")
+        
         # Show summary
         print("\n📈 Summary by scanner:")
         for scanner_name in SCANNERS.keys():
@@ -4,6 +4,7 @@ Upload scanner results from local database to MotherDuck.
 Run this after fixing the MotherDuck schema.
 """
 import duckdb
+from refresh_derived_tables import refresh_derived_tables
 
 # Your MotherDuck token (read-write needed)
 MOTHERDUCK_TOKEN = "YOUR_READWRITE_TOKEN_HERE"
@@ -16,7 +17,7 @@ results = local_conn.execute("""
     SELECT symbol, scanner_name, signal, strength, quality, scan_date
     FROM scanner_data.scanner_results
     ORDER BY scan_date DESC, symbol
-""").fetchall()
+""").fetchdf()
 
 print(f"Found {len(results)} scanner results")
 local_conn.close()
@@ -32,11 +33,15 @@ print("Clearing old data from MotherDuck...")
 motherduck_conn.execute("DELETE FROM scanner_data.scanner_results")
 
 print(f"Uploading {len(results)} records to MotherDuck...")
-motherduck_conn.executemany("""
+# One bulk INSERT ... SELECT from the DataFrame instead of a round-trip per row
+motherduck_conn.register('upload_results', results)
+motherduck_conn.execute("""
     INSERT INTO scanner_data.scanner_results 
     (symbol, scanner_name, signal, strength, quality, scan_date)
-    VALUES (?, ?, ?, ?, ?, ?)
-""", results)
+    SELECT symbol, scanner_name, signal, strength, quality, scan_date
+    FROM upload_results
+""")
+motherduck_conn.unregister('upload_results')
 
 print("✅ Upload complete!")
 
@@ -55,5 +60,13 @@ sample = motherduck_conn.execute("""
 for scanner, cnt in sample:
     print(f"  {scanner}: {cnt} signals")
 
+# Rebuild the dashboard's lookup tables from the uploaded results
+print("\nRefreshing derived tables...")
+try:
+    refresh_derived_tables(motherduck_conn)
+except Exception as e:
+    # The app computes the data per request until the next refresh
+    print(f"⚠️ Could not refresh derived tables: {e}")
+
 motherduck_conn.close()
 print("\n✅ Done! MotherDuck is now the source of truth.")